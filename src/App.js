@@ -5,7 +5,7 @@
  * It handles game state, user interactions, and UI updates following React best practices.
  */
 
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useLayoutEffect, useCallback, useMemo, useRef } from 'react';
 import GameBoard from './components/GameBoard';
 import Keyboard from './components/Keyboard';
 import SettingsModal from './components/SettingsModal';
@@ -13,18 +13,34 @@ import DropdownMenu from './components/DropdownMenu';
 import { useWordleGame } from './useWordleGame';
 import './App.css';
 
+// Letter keys accepted from the physical keyboard
+const LETTER_KEYS = new Set("ABCDEFGHIJKLMNOPQRSTUVWXYZ");
+
 function App() {
   const game = useWordleGame();
+  const { addLetter, removeLetter, newGame } = game;
   const [showGameOver, setShowGameOver] = useState(false);
   const [gameOverShown, setGameOverShown] = useState(false);
   const [isProcessingGuess, setIsProcessingGuess] = useState(false);
   const [showSettings, setShowSettings] = useState(false);
   const [isDarkMode, setIsDarkMode] = useState(false);
+  const processingTimerRef = useRef(null);
+
+  // Input is ignored once the game is over or while a guess is processing
+  const isInputLocked = game.gameOver || isProcessingGuess;
+
+  // Cancel a pending submission unlock when the app unmounts
+  useEffect(() => {
+    return () => clearTimeout(processingTimerRef.current);
+  }, []);
 
   // Submit guess handler
   const handleSubmitGuess = useCallback(() => {
-    if (isProcessingGuess) return; // Prevent multiple submissions
-    
+    // Prevent multiple submissions. The pending unlock timer is checked as
+    // well because isProcessingGuess is only visible after a re-render, so a
+    // second Enter arriving before then would otherwise resubmit.
+    if (isProcessingGuess || processingTimerRef.current !== null) return;
+
     try {
       if (!game.canSubmitGuess()) {
         alert("Please enter a 5-letter word from the word list!");
@@ -35,7 +51,8 @@ function App() {
       game.submitGuess();
       
       // Small delay to ensure state updates are processed
-      setTimeout(() => {
+      processingTimerRef.current = setTimeout(() => {
+        processingTimerRef.current = null;
         setIsProcessingGuess(false);
       }, 100);
     } catch (error) {
@@ -46,59 +63,92 @@ function App() {
 
   // Unified input handlers for both physical and virtual keyboards
   const handleLetterInput = useCallback((letter) => {
-    if (game.gameOver || isProcessingGuess) return;
-    game.addLetter(letter);
-  }, [game, isProcessingGuess]);
+    if (isInputLocked) return;
+    addLetter(letter);
+  }, [addLetter, isInputLocked]);
 
   const handleBackspaceInput = useCallback(() => {
-    if (game.gameOver || isProcessingGuess) return;
-    game.removeLetter();
-  }, [game, isProcessingGuess]);
+    if (isInputLocked) return;
+    removeLetter();
+  }, [removeLetter, isInputLocked]);
 
   const handleEnterInput = useCallback(() => {
-    if (game.gameOver || isProcessingGuess) return;
+    if (isInputLocked) return;
     handleSubmitGuess();
-  }, [game.gameOver, isProcessingGuess, handleSubmitGuess]);
+  }, [isInputLocked, handleSubmitGuess]);
 
   // Handle keyboard input
   const handleKeyPress = useCallback((event) => {
-    if (game.gameOver || isProcessingGuess) return;
+    if (isInputLocked) return;
 
-    const key = event.key.toUpperCase();
+    const { key } = event;
 
-    if (/^[A-Z]$/.test(key)) {
-      handleLetterInput(key);
-    } else if (key === 'ENTER') {
+    // Only single-character keys can be letters; skip the uppercase copy for
+    // named keys such as Shift or ArrowLeft
+    if (key.length === 1) {
+      const letter = key.toUpperCase();
+      if (LETTER_KEYS.has(letter)) {
+        handleLetterInput(letter);
+      }
+    } else if (key === 'Enter') {
       handleEnterInput();
-    } else if (key === 'BACKSPACE') {
+    } else if (key === 'Backspace') {
       handleBackspaceInput();
     }
-  }, [game.gameOver, isProcessingGuess, handleLetterInput, handleEnterInput, handleBackspaceInput]);
+  }, [isInputLocked, handleLetterInput, handleEnterInput, handleBackspaceInput]);
+
+  // Keep the latest key handler in a ref so the listener is bound only once.
+  // Updated in a layout effect so a keydown arriving before passive effects
+  // flush still sees this render's handler.
+  const keyPressHandlerRef = useRef(handleKeyPress);
+  useLayoutEffect(() => {
+    keyPressHandlerRef.current = handleKeyPress;
+  }, [handleKeyPress]);
 
   // Set up keyboard event listener
   useEffect(() => {
-    document.addEventListener('keydown', handleKeyPress);
+    const handleKeyDown = (event) => keyPressHandlerRef.current(event);
+    document.addEventListener('keydown', handleKeyDown);
     return () => {
-      document.removeEventListener('keydown', handleKeyPress);
+      document.removeEventListener('keydown', handleKeyDown);
     };
-  }, [handleKeyPress]);
+  }, []);
 
   // Handle game over state
   useEffect(() => {
     if (game.gameOver && !showGameOver && !gameOverShown) {
       // Small delay to let the last guess animate
-      setTimeout(() => {
+      const gameOverTimer = setTimeout(() => {
         setShowGameOver(true);
         setGameOverShown(true);
       }, 600);
+
+      // Cancel the pending modal if the game is reset or the app unmounts
+      return () => clearTimeout(gameOverTimer);
     }
   }, [game.gameOver, showGameOver, gameOverShown]);
 
-  const handleNewGame = () => {
-    game.newGame();
+  const handleNewGame = useCallback(() => {
+    newGame();
     setShowGameOver(false);
     setGameOverShown(false);
-  };
+  }, [newGame]);
+
+  // Menu entries only change if their handlers do, so build them once
+  const menuOptions = useMemo(() => [
+    {
+      id: 'new-game',
+      label: 'New Game',
+      icon: '🎮',
+      onClick: handleNewGame
+    },
+    {
+      id: 'settings',
+      label: 'Settings',
+      icon: '⚙️',
+      onClick: () => setShowSettings(true)
+    }
+  ], [handleNewGame]);
 
   const handleGameOverResponse = (playAgain) => {
     setShowGameOver(false);
@@ -114,20 +164,7 @@ function App() {
           <div className="app__header-line"></div>
           <div className="app__controls">
             <DropdownMenu
-              options={[
-                {
-                  id: 'new-game',
-                  label: 'New Game',
-                  icon: '🎮',
-                  onClick: handleNewGame
-                },
-                {
-                  id: 'settings',
-                  label: 'Settings',
-                  icon: '⚙️',
-                  onClick: () => setShowSettings(true)
-                }
-              ]}
+              options={menuOptions}
               disabled={isProcessingGuess}
             />
           </div>
@@ -147,7 +184,7 @@ function App() {
             onLetterClick={handleLetterInput}
             onEnterClick={handleEnterInput}
             onBackspaceClick={handleBackspaceInput}
-            gameOver={game.gameOver || isProcessingGuess}
+            gameOver={isInputLocked}
           />
           
           <footer className="app__footer">
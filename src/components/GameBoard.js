@@ -10,6 +10,40 @@ import GameTile from './GameTile';
 import { LETTER_STATUS } from '../gameLogic';
 import './GameBoard.css';
 
+/**
+ * Renders a single row of five tiles.
+ * Memoized so rows whose letters and evaluations are unchanged (completed
+ * guesses and empty rows while typing) are not re-rendered.
+ */
+const GameRow = React.memo(function GameRow({
+  letters = "",
+  results = null,
+  isInputRow = false
+}) {
+  const tiles = [];
+
+  for (let colIndex = 0; colIndex < 5; colIndex++) {
+    const letter = letters[colIndex] || "";
+    const evaluation = results ? results[colIndex] : undefined;
+    const status = evaluation ? evaluation[1] : LETTER_STATUS.UNUSED;
+
+    tiles.push(
+      <GameTile
+        key={colIndex}
+        letter={letter}
+        status={status}
+        isTyping={isInputRow && letter !== ""}
+      />
+    );
+  }
+
+  return (
+    <div className="game-board__row">
+      {tiles}
+    </div>
+  );
+});
+
 const GameBoard = ({ 
   guesses = [], 
   guessResults = [], 
@@ -17,68 +51,32 @@ const GameBoard = ({
   maxRounds = 6, 
   gameOver = false 
 }) => {
-  const renderRow = (rowIndex) => {
-    const tiles = [];
-    
+  const rows = [];
+  for (let rowIndex = 0; rowIndex < maxRounds; rowIndex++) {
     // If this row has a completed guess
     if (rowIndex < guesses.length) {
-      const guess = guesses[rowIndex];
-      const results = guessResults[rowIndex];
-      
-      for (let colIndex = 0; colIndex < 5; colIndex++) {
-        const letter = guess[colIndex] || "";
-        const status = results[colIndex] ? results[colIndex][1] : LETTER_STATUS.UNUSED;
-        
-        tiles.push(
-          <GameTile
-            key={`${rowIndex}-${colIndex}`}
-            letter={letter}
-            status={status}
-            isTyping={false}
-          />
-        );
-      }
+      rows.push(
+        <GameRow
+          key={rowIndex}
+          letters={guesses[rowIndex]}
+          results={guessResults[rowIndex]}
+        />
+      );
     }
     // If this is the current input row
     else if (rowIndex === guesses.length && !gameOver) {
-      for (let colIndex = 0; colIndex < 5; colIndex++) {
-        const letter = currentInput[colIndex] || "";
-        const isTyping = letter !== "";
-        
-        tiles.push(
-          <GameTile
-            key={`${rowIndex}-${colIndex}`}
-            letter={letter}
-            status={LETTER_STATUS.UNUSED}
-            isTyping={isTyping}
-          />
-        );
-      }
+      rows.push(
+        <GameRow
+          key={rowIndex}
+          letters={currentInput}
+          isInputRow={true}
+        />
+      );
     }
     // Empty rows
     else {
-      for (let colIndex = 0; colIndex < 5; colIndex++) {
-        tiles.push(
-          <GameTile
-            key={`${rowIndex}-${colIndex}`}
-            letter=""
-            status={LETTER_STATUS.UNUSED}
-            isTyping={false}
-          />
-        );
-      }
+      rows.push(<GameRow key={rowIndex} />);
     }
-    
-    return (
-      <div key={rowIndex} className="game-board__row">
-        {tiles}
-      </div>
-    );
-  };
-
-  const rows = [];
-  for (let i = 0; i < maxRounds; i++) {
-    rows.push(renderRow(i));
   }
 
   return (
@@ -9,24 +9,22 @@ import React from 'react';
 import { LETTER_STATUS } from '../gameLogic';
 import './GameTile.css';
 
+// Class names per status, built once instead of per render
+const STATUS_CLASS_NAMES = Object.freeze({
+  [LETTER_STATUS.HIT]: "game-tile game-tile--hit",
+  [LETTER_STATUS.PRESENT]: "game-tile game-tile--present",
+  [LETTER_STATUS.MISS]: "game-tile game-tile--miss"
+});
+const TYPING_CLASS_NAME = "game-tile game-tile--typing";
+const EMPTY_CLASS_NAME = "game-tile game-tile--empty";
+
 const GameTile = ({ letter = "", status = LETTER_STATUS.UNUSED, isTyping = false }) => {
   const getClassName = () => {
-    const baseClass = "game-tile";
-    
     if (isTyping) {
-      return `${baseClass} game-tile--typing`;
-    }
-    
-    switch (status) {
-      case LETTER_STATUS.HIT:
-        return `${baseClass} game-tile--hit`;
-      case LETTER_STATUS.PRESENT:
-        return `${baseClass} game-tile--present`;
-      case LETTER_STATUS.MISS:
-        return `${baseClass} game-tile--miss`;
-      default:
-        return `${baseClass} game-tile--empty`;
+      return TYPING_CLASS_NAME;
     }
+
+    return STATUS_CLASS_NAMES[status] || EMPTY_CLASS_NAME;
   };
 
   return (
@@ -36,4 +34,5 @@ const GameTile = ({ letter = "", status = LETTER_STATUS.UNUSED, isTyping = false
   );
 };
 
-export default GameTile;
+// Tiles only depend on primitive props, so skip re-rendering unchanged ones
+export default React.memo(GameTile);
@@ -5,10 +5,42 @@
  * Shows letter status colors based on game state.
  */
 
-import React from 'react';
+import React, { useCallback } from 'react';
 import { LETTER_STATUS } from '../gameLogic';
 import './Keyboard.css';
 
+// QWERTY layout split into letter arrays once at module load
+const KEYBOARD_ROWS = [
+  "QWERTYUIOP",
+  "ASDFGHJKL",
+  "ZXCVBNM"
+].map(row => Array.from(row));
+
+// Class names per letter status, built once instead of per key per render
+const KEY_CLASS_NAMES = Object.freeze({
+  [LETTER_STATUS.HIT]: "keyboard__key keyboard__key--hit",
+  [LETTER_STATUS.PRESENT]: "keyboard__key keyboard__key--present",
+  [LETTER_STATUS.MISS]: "keyboard__key keyboard__key--miss"
+});
+const UNUSED_KEY_CLASS_NAME = "keyboard__key keyboard__key--unused";
+
+/**
+ * Single letter key. Memoized so that only keys whose status or disabled
+ * state changed are re-rendered when the keyboard updates.
+ */
+const KeyboardKey = React.memo(function KeyboardKey({ letter, className, onPress, disabled }) {
+  return (
+    <button
+      className={className}
+      data-letter={letter}
+      onClick={onPress}
+      disabled={disabled}
+    >
+      {letter}
+    </button>
+  );
+});
+
 const Keyboard = ({ 
   letterStatus = {}, 
   onLetterClick, 
@@ -16,33 +48,16 @@ const Keyboard = ({
   onBackspaceClick,
   gameOver = false 
 }) => {
-  const keyboardRows = [
-    "QWERTYUIOP",
-    "ASDFGHJKL",
-    "ZXCVBNM"
-  ];
-
   const getKeyClassName = (letter) => {
-    const baseClass = "keyboard__key";
-    const status = letterStatus[letter] || LETTER_STATUS.UNUSED;
-    
-    switch (status) {
-      case LETTER_STATUS.HIT:
-        return `${baseClass} keyboard__key--hit`;
-      case LETTER_STATUS.PRESENT:
-        return `${baseClass} keyboard__key--present`;
-      case LETTER_STATUS.MISS:
-        return `${baseClass} keyboard__key--miss`;
-      default:
-        return `${baseClass} keyboard__key--unused`;
-    }
+    return KEY_CLASS_NAMES[letterStatus[letter]] || UNUSED_KEY_CLASS_NAME;
   };
 
-  const handleKeyClick = (letter) => {
+  // Shared by all letter keys; the letter is read from the clicked button
+  const handleKeyClick = useCallback((event) => {
     if (!gameOver && onLetterClick) {
-      onLetterClick(letter);
+      onLetterClick(event.currentTarget.dataset.letter);
     }
-  };
+  }, [gameOver, onLetterClick]);
 
   const handleEnterClick = () => {
     if (!gameOver && onEnterClick) {
@@ -58,7 +73,7 @@ const Keyboard = ({
 
   return (
     <div className="keyboard">
-      {keyboardRows.map((row, rowIndex) => (
+      {KEYBOARD_ROWS.map((row, rowIndex) => (
         <div key={rowIndex} className="keyboard__row">
           {/* Add ENTER button to the last row (start) */}
           {rowIndex === 2 && (
@@ -72,15 +87,14 @@ const Keyboard = ({
           )}
           
           {/* Letter keys */}
-          {Array.from(row).map((letter) => (
-            <button
+          {row.map((letter) => (
+            <KeyboardKey
               key={letter}
+              letter={letter}
               className={getKeyClassName(letter)}
-              onClick={() => handleKeyClick(letter)}
+              onPress={handleKeyClick}
               disabled={gameOver}
-            >
-              {letter}
-            </button>
+            />
           ))}
           
           {/* Add BACKSPACE button to the last row (end) */}
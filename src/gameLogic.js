@@ -17,6 +17,13 @@ export const LETTER_STATUS = {
   UNUSED: "UNUSED"    // Letter has not been guessed yet (Default state)
 };
 
+// Letter status tracking for a fresh game, built once and shared by all games
+const INITIAL_LETTER_STATUS = {};
+for (let i = 65; i <= 90; i++) { // A-Z ASCII codes
+  INITIAL_LETTER_STATUS[String.fromCharCode(i)] = LETTER_STATUS.UNUSED;
+}
+Object.freeze(INITIAL_LETTER_STATUS);
+
 /**
  * Creates initial game state
  * @param {number} maxRounds - Maximum number of guess attempts
@@ -37,22 +44,17 @@ export function createInitialGameState(maxRounds = DEFAULT_MAX_ROUNDS, wordList
     throw new Error("wordList must be a non-empty array");
   }
 
-  // Initialize letter status tracking
-  const letterStatus = {};
-  for (let i = 65; i <= 90; i++) { // A-Z ASCII codes
-    letterStatus[String.fromCharCode(i)] = LETTER_STATUS.UNUSED;
-  }
-
   return {
     targetWord: selectRandomWord(wordList),
     guessHistory: [],
     currentRound: 0,
     gameOver: false,
     isWon: false,
-    letterStatus,
+    letterStatus: INITIAL_LETTER_STATUS, // Frozen; updates always copy
     currentInput: "",
     maxRounds,
-    wordList: [...wordList] // Defensive copy
+    wordList: [...wordList], // Defensive copy
+    wordSet: new Set(wordList) // Constant-time dictionary lookups
   };
 }
 
@@ -66,6 +68,19 @@ function selectRandomWord(wordList) {
   return wordList[randomIndex];
 }
 
+/**
+ * Normalizes raw guess input for validation and evaluation
+ * @param {string} guess - Raw guess input
+ * @returns {string} Trimmed uppercase guess, or "" for non-string input
+ */
+function normalizeGuess(guess) {
+  if (!guess || typeof guess !== 'string') {
+    return "";
+  }
+
+  return guess.trim().toUpperCase();
+}
+
 /**
  * Validates whether a guess meets all game requirements
  * @param {string} guess - The word to validate
@@ -73,12 +88,16 @@ function selectRandomWord(wordList) {
  * @returns {boolean} True if guess is valid for submission
  */
 export function isValidGuess(guess, gameState) {
-  if (!guess || typeof guess !== 'string') {
-    return false;
-  }
-
-  const normalizedGuess = guess.trim().toUpperCase();
+  return isValidNormalizedGuess(normalizeGuess(guess), gameState);
+}
 
+/**
+ * Validates a guess that has already been normalized
+ * @param {string} normalizedGuess - Trimmed uppercase guess
+ * @param {object} gameState - Current game state
+ * @returns {boolean} True if guess is valid for submission
+ */
+function isValidNormalizedGuess(normalizedGuess, gameState) {
   // Length validation
   if (normalizedGuess.length !== 5) {
     return false;
@@ -90,7 +109,7 @@ export function isValidGuess(guess, gameState) {
   }
 
   // Word list validation (core Wordle rule)
-  if (!gameState.wordList.includes(normalizedGuess)) {
+  if (!gameState.wordSet.has(normalizedGuess)) {
     return false;
   }
 
@@ -109,27 +128,32 @@ export function makeGuess(gameState, guess) {
     throw new Error("Cannot make guess: game is already over");
   }
 
-  if (!isValidGuess(guess, gameState)) {
+  // Normalize once and reuse for validation and evaluation
+  const normalizedGuess = normalizeGuess(guess);
+
+  if (!isValidNormalizedGuess(normalizedGuess, gameState)) {
     throw new Error("Invalid guess: must be a 5-letter word from the allowed word list");
   }
 
-  const normalizedGuess = guess.trim().toUpperCase();
+  // Core evaluation logic. Frozen because the arrays are shared with the UI
+  // by getGameStateInfo rather than copied.
+  const evaluations = Object.freeze(
+    evaluateGuessAgainstTarget(normalizedGuess, gameState.targetWord).map(Object.freeze)
+  );
 
-  // Core evaluation logic
-  const evaluations = evaluateGuessAgainstTarget(normalizedGuess, gameState.targetWord);
+  const isCorrect = normalizedGuess === gameState.targetWord;
 
   // Create guess result
   const guessResult = {
     word: normalizedGuess,
     evaluations,
     roundNumber: gameState.currentRound + 1,
-    isCorrect: normalizedGuess === gameState.targetWord
+    isCorrect
   };
 
   // Update state
   const newCurrentRound = gameState.currentRound + 1;
   const newLetterStatus = updateLetterStatus(gameState.letterStatus, evaluations);
-  const isCorrect = normalizedGuess === gameState.targetWord;
   const isGameOver = isCorrect || newCurrentRound >= gameState.maxRounds;
 
   return {
@@ -282,9 +306,8 @@ export function getGameStateInfo(gameState) {
     currentRound: gameState.currentRound,
     maxRounds: gameState.maxRounds,
     guesses: gameState.guessHistory.map(result => result.word),
-    guessResults: gameState.guessHistory.map(result => 
-      result.evaluations.map(([letter, status]) => [letter, status])
-    ),
+    // Evaluations are frozen, so share them to keep row identity stable
+    guessResults: gameState.guessHistory.map(result => result.evaluations),
     gameOver: gameState.gameOver,
     won: gameState.isWon,
     answer: gameState.gameOver ? gameState.targetWord : null,
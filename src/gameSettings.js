@@ -19,8 +19,8 @@ export const DEFAULT_MAX_ROUNDS = 6;
  * Type: Immutable constant to prevent accidental modification
  */
 
-// Curated Word Database
-export const WORD_LIST = [
+// Curated Word Database (frozen so derived data can be cached safely)
+export const WORD_LIST = Object.freeze([
   "ABOUT",
   "AFTER",
   "AGAIN",
@@ -36,7 +36,7 @@ export const WORD_LIST = [
   "WORDS",
   "TESTS",
   "QUICK"
-];
+]);
 
 /**
  * Validates the integrity and consistency of the word database.
@@ -55,7 +55,10 @@ export function validateWordListIntegrity() {
     throw new Error("Word list cannot be empty");
   }
 
-  // Validate each word meets game requirements
+  // Validate each word meets game requirements, collecting repeated entries
+  // in the same pass
+  const seenWords = new Set();
+  const duplicates = [];
   for (let index = 0; index < WORD_LIST.length; index++) {
     const word = WORD_LIST[index];
     
@@ -66,18 +69,25 @@ export function validateWordListIntegrity() {
     if (!/^[A-Z]+$/.test(word)) {
       throw new Error(`Word at index ${index} '${word}' contains non-alphabetic characters or is not uppercase`);
     }
+
+    if (seenWords.has(word)) {
+      duplicates.push(word);
+    } else {
+      seenWords.add(word);
+    }
   }
 
   // Validate uniqueness (no duplicates)
-  const uniqueWords = new Set(WORD_LIST);
-  if (WORD_LIST.length !== uniqueWords.size) {
-    const duplicates = WORD_LIST.filter((word, index) => WORD_LIST.indexOf(word) !== index);
+  if (duplicates.length > 0) {
     throw new Error(`Duplicate words found in word list: ${duplicates.join(', ')}`);
   }
 
   return true;
 }
 
+// Statistics for the frozen WORD_LIST, computed on first request
+let cachedWordStatistics = null;
+
 /**
  * Analyzes word list and returns statistical information for game balancing.
  *
@@ -86,24 +96,36 @@ export function validateWordListIntegrity() {
  *   - avgVowelCount: Average vowels per word
  *   - letterFrequency: Distribution of letters across all words
  *   - mostCommonLetters: Top 5 most common letters
+ *   The result is computed once and returned frozen on later calls.
  */
 export function getWordStatistics() {
+  if (cachedWordStatistics === null) {
+    cachedWordStatistics = deepFreeze(computeWordStatistics());
+  }
+  return cachedWordStatistics;
+}
+
+/**
+ * Computes word list statistics without caching.
+ * @returns {object} Statistics as described in getWordStatistics
+ */
+function computeWordStatistics() {
   if (!WORD_LIST || WORD_LIST.length === 0) {
     return { error: "Word list is empty" };
   }
 
-  const vowels = new Set(['A', 'E', 'I', 'O', 'U']);
-  const totalVowels = WORD_LIST.reduce((sum, word) => {
-    return sum + Array.from(word).filter(char => vowels.has(char)).length;
-  }, 0);
-
-  // Calculate letter frequency distribution
+  // Calculate letter frequency distribution in a single pass
   const letterFrequency = {};
-  WORD_LIST.forEach(word => {
-    Array.from(word).forEach(char => {
+  for (const word of WORD_LIST) {
+    for (const char of word) {
       letterFrequency[char] = (letterFrequency[char] || 0) + 1;
-    });
-  });
+    }
+  }
+
+  const totalVowels = ['A', 'E', 'I', 'O', 'U'].reduce(
+    (sum, vowel) => sum + (letterFrequency[vowel] || 0),
+    0
+  );
 
   const mostCommonLetters = Object.entries(letterFrequency)
     .sort(([, a], [, b]) => b - a)
@@ -117,15 +139,25 @@ export function getWordStatistics() {
   };
 }
 
-// Module initialization: Validate configuration on load
+/**
+ * Recursively freezes a plain object or array.
+ * @param {object} value - Object to freeze
+ * @returns {object} The same object, frozen
+ */
+function deepFreeze(value) {
+  Object.values(value).forEach(child => {
+    if (child !== null && typeof child === 'object') {
+      deepFreeze(child);
+    }
+  });
+  return Object.freeze(value);
+}
+
+// Module initialization: Validate configuration on load.
+// Statistics are only needed for balancing work, so they are computed on
+// demand via getWordStatistics() rather than on every page load.
 try {
   validateWordListIntegrity();
-  console.log("Word list validation passed");
-  
-  const stats = getWordStatistics();
-  console.log("Game statistics:", stats);
-  
-  console.log("All configuration validation checks passed");
 } catch (configError) {
   console.error("Configuration validation failed:", configError.message);
 }
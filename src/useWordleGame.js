@@ -5,7 +5,7 @@
  * for React components to interact with the game engine.
  */
 
-import { useState, useCallback } from 'react';
+import { useState, useCallback, useMemo } from 'react';
 import {
   createInitialGameState,
   makeGuess,
@@ -66,13 +66,12 @@ export function useWordleGame(initialMaxRounds = DEFAULT_MAX_ROUNDS, initialWord
 
   // Check if current input is valid for submission
   const canSubmitGuess = useCallback(() => {
-    const gameInfo = getGameStateInfo(gameState);
-    return gameInfo.currentInput.length === 5 && 
-           isValidGuess(gameInfo.currentInput, gameState);
+    return gameState.currentInput.length === 5 && 
+           isValidGuess(gameState.currentInput, gameState);
   }, [gameState]);
 
-  // Get formatted game state for UI
-  const gameInfo = getGameStateInfo(gameState);
+  // Get formatted game state for UI, recomputed only when the state changes
+  const gameInfo = useMemo(() => getGameStateInfo(gameState), [gameState]);
 
   return {
     // Game state